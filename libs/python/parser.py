@@ -1,9 +1,216 @@
 import re
 import json
 import os
-from typing import Any, Dict, List, Union, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, the stdlib json module is used without it
+    orjson = None
+
+# Regexes used on the hot parse path, compiled once at import time
+_RE_INCLUDE = re.compile(r'include\s+["\']([^"\']+)["\']')
+_RE_ENV = re.compile(r'\$ENV\{([^}]+)\}')
+_RE_ARRAY_WS = re.compile(r'\s*\n\s*')
+# Matches comments and quoted strings in a single pass over the content. Strings
+# are matched only so that comment markers inside them are skipped; they never
+# span lines. Block comments must win over stray quotes, as they did when they
+# were stripped in a separate pass: a quote that opens mid-word (the apostrophe in
+# O'Brien) or that is never closed stops before a '/*'.
+_RE_ALL_COMMENTS = re.compile(
+    r'/\*.*?\*/'
+    r'|(?<=\w)(?:"(?:\\[^\n]|[^"\\\n/]|/(?!\*))*"?|\'(?:\\[^\n]|[^\'\\\n/]|/(?!\*))*\'?)'
+    r'|"(?:\\[^\n]|[^"\\\n])*"|"(?:\\[^\n]|[^"\\\n/]|/(?!\*))*'
+    r'|\'(?:\\[^\n]|[^\'\\\n])*\'|\'(?:\\[^\n]|[^\'\\\n/]|/(?!\*))*'
+    r'|//[^\n]*',
+    re.DOTALL)
+# Quoted strings (an unterminated quote runs to the end) and arithmetic operators
+_RE_STRIP_STRINGS = re.compile(r'"(?:\\.|[^"\\])*"?|\'(?:\\.|[^\'\\])*\'?', re.DOTALL)
+_RE_OPS = re.compile(r'[+\-*/%]')
+_RE_IDENT = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*\Z')
+# A bare identifier or dot-separated path: no quotes, brackets or operators
+_RE_DOTTED_NAME = re.compile(r'[a-zA-Z_][a-zA-Z0-9_.]*\Z')
+_RE_ARRAY_DELIMS = re.compile(r'[\[\]{},]')
+# 19+ digit runs may be integers outside orjson's 64-bit range (decoded as floats)
+_RE_LONG_DIGITS = re.compile(r'\d{19}')
+# Characters that mark a line without '=' as part of a JSON-like structure
+_RE_STRUCTURE_CHARS = re.compile(r'[\[\]{},"\']')
+# Skips quoted strings so that only an '=' outside of them is captured in group 1
+_RE_KEY_VALUE_SCAN = re.compile(r'"(?:\\.|[^"\\])*"?|\'(?:\\.|[^\'\\])*\'?|(=)')
+# Expression tokens: a quoted string (no escapes, may be unterminated), an
+# operator or parenthesis, or any other run of characters up to the next delimiter
+_RE_EXPR_TOKEN = re.compile(r'"[^"]*"?|\'[^\']*\'?|[-+*/%()]|[^\s"\'+\-*/%()]+')
+# String escape sequences supported inside quoted values
+_ESCAPE_SEQUENCES = {
+    'n': '\n',
+    't': '\t',
+    'r': '\r',
+    '\\': '\\',
+    '"': '"',
+    "'": "'"
+}
+_RE_ESCAPE = re.compile(r'\\([ntr\\"\'])')
+
+# Expression operators, as frozensets for O(1) membership tests
+_MULDIV = frozenset('*/%')
+_ADDSUB = frozenset('+-')
+_OPERATORS = _MULDIV | _ADDSUB
+
+# Case-insensitive literal words, and the strings accepted by the .bool conversion
+_LITERAL_WORDS = frozenset(('true', 'false', 'null'))
+_BRACE_LINES = frozenset(('{', '}'))
+_BOOL_TRUE = frozenset(('true', 'yes', '1'))
+_BOOL_FALSE = frozenset(('false', 'no', '0'))
+
+# Cache lookup sentinel, distinct from a cached None
+_MISS = object()
+
+# Target types of the explicit conversion suffixes (e.g. "123.int")
+_TYPE_NAMES = frozenset(('int', 'float', 'string', 'bool'))
+
+# Characters a float() literal can start with, besides (unicode) digits, and the
+# words float() accepts on their own
+_NUMBER_START = frozenset('+-.')
+_FLOAT_WORDS = frozenset(('inf', 'infinity', 'nan'))
+
+
+def _strip_comment(match: re.Match) -> str:
+    """Substitution callback for `_RE_ALL_COMMENTS`: drop comments, keep strings."""
+    token = match.group(0)
+    return '' if token.startswith(('/*', '//')) else token
+
+
+def _mask_string(match: re.Match) -> str:
+    """Substitution callback for `_RE_STRIP_STRINGS` that preserves offsets."""
+    return '_' * len(match.group(0))
+
+
+def _resolve_escape(match: re.Match) -> str:
+    """Substitution callback for `_RE_ESCAPE`."""
+    return _ESCAPE_SEQUENCES[match.group(1)]
+
+
+def _json_loads(value_str: str) -> Any:
+    """Decode JSON with orjson when it is installed, falling back to `json.loads`."""
+    # orjson silently turns integers beyond 64 bits into floats, so anything with
+    # a long digit run goes to the stdlib, which keeps them exact
+    if orjson is not None and not _RE_LONG_DIGITS.search(value_str):
+        try:
+            return orjson.loads(value_str)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (e.g. NaN); let the stdlib decide
+            # whether the value is really invalid
+            pass
+    return json.loads(value_str)
+
+
+def _find_matching_bracket(ref: str, open_idx: int) -> int:
+    """
+    Find the ']' that closes the '[' at `open_idx`, allowing nested brackets.
+
+    Args:
+        ref (str): The reference string.
+        open_idx (int): The index of the opening bracket.
+
+    Returns:
+        int: The index of the matching closing bracket.
+
+    Raises:
+        UCLSyntaxError: If the bracket is never closed.
+    """
+    depth = 1
+    next_open = ref.find('[', open_idx + 1)
+    close_idx = ref.find(']', open_idx + 1)
+
+    # Walk the bracket positions in order; with no nesting this is a single step
+    while close_idx != -1:
+        if next_open != -1 and next_open < close_idx:
+            depth += 1
+            next_open = ref.find('[', next_open + 1)
+        else:
+            depth -= 1
+            if depth == 0:
+                return close_idx
+            close_idx = ref.find(']', close_idx + 1)
+
+    raise UCLSyntaxError(f"Mismatched brackets in reference: {ref}")
+
+
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dot-separated path into its parts (memoized, hence the tuple)."""
+    return tuple(path.split('.'))
+
+
+@lru_cache(maxsize=4096)
+def _classify(value_str: str) -> Tuple[bool, bool, bool]:
+    """
+    Classify a value string as a simple literal, an expression and/or a reference.
+
+    The result only depends on the string itself, so it is memoized; config files
+    tend to repeat the same values and expression operands many times.
+
+    Args:
+        value_str (str): The string to classify.
+
+    Returns:
+        Tuple[bool, bool, bool]: `(is_simple_literal, contains_operators,
+            is_variable_reference)` for the string.
+    """
+    value_str = value_str.strip()
+
+    # Bare names are the common case (references); the only literals among them
+    # are a few keywords, so skip the operator scan and the literal checks
+    if _RE_DOTTED_NAME.match(value_str):
+        lowered = value_str.lower()
+        is_simple = lowered in _LITERAL_WORDS or lowered in _FLOAT_WORDS
+        return is_simple, False, not is_simple
+
+    # Arithmetic operators (+, -, *, /, %) outside of quoted strings
+    has_ops = bool(_RE_OPS.search(_RE_STRIP_STRINGS.sub('', value_str)))
+
+    is_simple = _is_simple(value_str, has_ops)
+
+    # A reference contains dots for nested access, or is a plain identifier
+    is_ref = not is_simple and ('.' in value_str or bool(_RE_IDENT.match(value_str)))
+
+    return is_simple, has_ops, is_ref
+
+
+def _is_simple(value_str: str, has_ops: bool) -> bool:
+    """Literal check behind `_classify`; `has_ops` is its operator scan result."""
+    # Quoted string literal
+    if value_str.startswith('"') and value_str.endswith('"') and not has_ops:
+        # Only consider it a simple string if it doesn't also look like an expression
+        # inside (e.g. "'1+2'") - though _parse_string handles escapes for real strings.
+        # This is primarily to distinguish "ref" from "literal" and not evaluate "ref"
+        # as an expression.
+        return True
+
+    # JSON array or object literal
+    if (value_str.startswith('[') and value_str.endswith(']')) or \
+       (value_str.startswith('{') and value_str.endswith('}')):
+        return True
+
+    # Boolean or null literal (case-insensitive)
+    lowered = value_str.lower()
+    if lowered in _LITERAL_WORDS:
+        return True
+
+    # Numeric literal. Only probe float() when the string can plausibly be one,
+    # so plain words don't go through the (slow) exception path.
+    if value_str and (value_str[0] in _NUMBER_START or value_str[0].isdigit() or
+                      lowered in _FLOAT_WORDS):
+        try:
+            float(value_str)  # Try converting to float for both int and float
+            return True
+        except ValueError:
+            pass
+
+    return False
+
 
 class UCLError(Exception):
     """Base exception for UCL parsing errors."""
@@ -25,6 +232,68 @@ class UCLTypeError(UCLError):
     pass
 
 
+def _conv_int(value: Any) -> int:
+    """Convert a value to int for the `.int` suffix."""
+    # Already-typed values (e.g. resolved references) skip the string round trip;
+    # bools still go through it and are rejected as before
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+
+    try:
+        if isinstance(value, float):
+            return int(value)
+        # Convert via float first to handle string floats like "123.0"
+        return int(float(str(value)))
+    except (ValueError, OverflowError):
+        # OverflowError: infinity; ValueError: NaN or a non-numeric string
+        raise UCLTypeError(f"Cannot convert '{value}' to int")
+
+
+def _conv_float(value: Any) -> float:
+    """Convert a value to float for the `.float` suffix."""
+    if isinstance(value, float):
+        return value
+
+    try:
+        return float(value)
+    except ValueError:
+        raise UCLTypeError(f"Cannot convert '{value}' to float")
+
+
+def _conv_string(value: Any) -> str:
+    """Convert a value to str for the `.string` suffix."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _conv_bool(value: Any) -> bool:
+    """Convert a value to bool for the `.bool` suffix."""
+    if isinstance(value, bool):
+        return value
+    elif isinstance(value, (int, float)):
+        return value != 0  # 0 is False, any other number is True
+    elif isinstance(value, str):
+        lower_val = value.lower()
+        if lower_val in _BOOL_TRUE:
+            return True
+        elif lower_val in _BOOL_FALSE:
+            return False
+        raise UCLTypeError(f"Cannot convert string '{value}' to bool")
+    raise UCLTypeError(f"Cannot convert '{value}' to bool")
+
+
+# Type suffix name -> converter, used by UCLParser._convert_type
+_CONVERTERS = {
+    'int': _conv_int,
+    'float': _conv_float,
+    'string': _conv_string,
+    'bool': _conv_bool,
+}
+
+
 class UCLParser:
     """
     Universal Configuration Language (UCL) Parser.
@@ -35,18 +304,36 @@ class UCLParser:
     variable references, arithmetic expressions, and default values.
     """
 
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = ('config', 'current_section', 'defaults', 'base_path', '_include_cache',
+                 '_ref_cache', '_defaults_prepared', '_section_key',
+                 '_current_section_dict')
+
     def __init__(self):
         """
         Initializes the UCLParser.
 
         Sets up the internal state for parsing, including the configuration dictionary,
-        current parsing section, default values, environment variables, and base path.
+        current parsing section, default values, and base path. Environment variables
+        are read from `os.environ` when they are referenced.
+        """
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Restore the parser to its freshly constructed state.
+
+        Clears the configuration, defaults, current section and internal caches, and
+        resets the base path for includes to the current working directory. This lets
+        one parser instance be reused for many unrelated parses.
         """
         self.config = {}
-        self.current_section = []
+        self._enter_section([])
         self.defaults = {}
-        self.env_vars = os.environ.copy()
         self.base_path = Path.cwd()
+        self._include_cache = {}
+        self._ref_cache = {}
+        self._defaults_prepared = None
 
     def parse_file(self, filepath: Union[str, Path]) -> Dict[str, Any]:
         """
@@ -65,8 +352,7 @@ class UCLParser:
         filepath = Path(filepath)
         self.base_path = filepath.parent
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = filepath.read_text(encoding='utf-8')
 
         return self.parse_string(content)
 
@@ -84,13 +370,16 @@ class UCLParser:
             UCLError: For any errors encountered during parsing.
         """
         self.config = {}
-        self.current_section = []
+        self._enter_section([])
         self.defaults = {}
+        self._include_cache = {}
+        self._ref_cache = {}
+        self._defaults_prepared = None
 
         content = self._remove_comments(content)
-        lines = content.split('\n')
 
-        lines = self._process_includes(lines)
+        # Included lines are streamed in; only the final line list is materialized
+        lines = list(self._process_includes(content.split('\n')))
 
         self._parse_lines(lines)
 
@@ -108,82 +397,85 @@ class UCLParser:
         Returns:
             str: The content string with comments removed.
         """
-        # Remove multi-line comments first
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-
-        lines = content.split('\n')
-        cleaned_lines = []
-
-        for line in lines:
-            in_string = False
-            quote_char = None
-            i = 0
-
-            while i < len(line):
-                char = line[i]
-
-                if not in_string and char in ['"', "'"]:
-                    in_string = True
-                    quote_char = char
-                elif in_string and char == quote_char and \
-                        (i == 0 or line[i - 1] != '\\'):
-                    in_string = False
-                    quote_char = None
-                elif not in_string and char == '/' and i + 1 < len(line) and \
-                        line[i + 1] == '/':
-                    line = line[:i]  # Remove rest of the line
-                    break
-
-                i += 1
-
-            cleaned_lines.append(line)
-
-        return '\n'.join(cleaned_lines)
+        return _RE_ALL_COMMENTS.sub(_strip_comment, content)
 
-    def _process_includes(self, lines: List[str]) -> List[str]:
+    def _process_includes(self, lines: Iterable[str]) -> Iterator[str]:
         """
         Process 'include' directives in the UCL content.
 
         This method replaces `include "path/to/file.ucl"` lines with the
-        content of the included files. Includes are processed recursively.
+        content of the included files. Includes are processed recursively,
+        using an explicit stack; each file is read and expanded only once per
+        parse, no matter how many times it is included.
 
         Args:
-            lines (List[str]): A list of lines from the UCL content.
+            lines (Iterable[str]): The lines from the UCL content.
 
-        Returns:
-            List[str]: A new list of lines with included content integrated.
+        Yields:
+            str: The stripped lines, with included content integrated.
 
         Raises:
-            UCLError: If an included file is not found.
+            UCLError: If an included file is not found or includes itself.
             UCLSyntaxError: If the include syntax is invalid.
         """
-        processed_lines = []
+        # Each frame holds the remaining lines of a file, the expanded output
+        # collected so far, and the file's resolved path. The root frame has no
+        # output list or path: its lines are yielded straight to the caller.
+        stack = [(iter(lines), None, None)]
+        in_progress = set()
+
+        while stack:
+            line_iter, output, current_path = stack[-1]
+
+            for line in line_iter:
+                line = line.strip()
+                if line.startswith('include '):
+                    # A valid include always quotes its path; skip the regex otherwise
+                    if '"' in line or "'" in line:
+                        match = _RE_INCLUDE.match(line)
+                    else:
+                        match = None
+                    if not match:
+                        raise UCLSyntaxError(f"Invalid include syntax: {line}")
 
-        for line in lines:
-            line = line.strip()
-            if line.startswith('include '):
-                match = re.match(r'include\s+["\']([^"\']+)["\']', line)
-                if match:
                     include_path = match.group(1)
-                    full_path = self.base_path / include_path
+                    full_path = (self.base_path / include_path).resolve()
+
+                    cached = self._include_cache.get(full_path)
+                    if cached is not None:
+                        if output is None:
+                            yield from cached
+                        else:
+                            output.extend(cached)
+                        continue
+
+                    if full_path in in_progress:
+                        raise UCLError(f"Circular include detected: {include_path}")
+                    if not full_path.exists():
+                        raise UCLError(f"Include file not found: {include_path}")
 
-                    if full_path.exists():
-                        with open(full_path, 'r', encoding='utf-8') as f:
-                            include_content = f.read()
+                    include_content = full_path.read_text(encoding='utf-8')
 
-                        # Recursively process includes in the included file
-                        include_content = self._remove_comments(include_content)
-                        include_lines = include_content.split('\n')
-                        include_lines = self._process_includes(include_lines)
-                        processed_lines.extend(include_lines)
-                    else:
-                        raise UCLError(f"Include file not found: {include_path}")
+                    # Descend into the included file; this frame resumes afterwards
+                    include_content = self._remove_comments(include_content)
+                    in_progress.add(full_path)
+                    stack.append((iter(include_content.split('\n')), [], full_path))
+                    break
+                elif output is None:
+                    yield line
                 else:
-                    raise UCLSyntaxError(f"Invalid include syntax: {line}")
+                    output.append(line)
             else:
-                processed_lines.append(line)
-
-        return processed_lines
+                # All lines of this file are expanded, hand them to the includer
+                stack.pop()
+                if current_path is not None:
+                    in_progress.discard(current_path)
+                    self._include_cache[current_path] = output
+                    parent_output = stack[-1][1]
+                    if parent_output is None:
+                        yield from output
+                    else:
+                        parent_output.extend(output)
 
     def _parse_lines(self, lines: List[str]) -> None:
         """
@@ -203,7 +495,7 @@ class UCLParser:
                 i += 1
                 continue
 
-            if line.startswith('[') and line.endswith(']'):
+            if line[0] == '[' and line[-1] == ']':  # line is non-empty here
                 section_name = line[1:-1].strip()
 
                 if section_name.lower() == 'defaults':
@@ -212,11 +504,27 @@ class UCLParser:
                     # Once defaults are parsed, there should be no more config
                     break
                 else:
-                    self.current_section = section_name.split('.')
+                    self._enter_section(section_name.split('.'))
                     i += 1
             else:
                 i = self._parse_key_value(lines, i)
 
+    def _enter_section(self, parts: List[str]) -> None:
+        """
+        Make the given section path the current section.
+
+        All section changes go through here so that the derived section state is
+        only rebuilt when the section changes, not for every key parsed in it.
+
+        Args:
+            parts (List[str]): The section path components (empty for the root).
+        """
+        self.current_section = parts
+        # Hashable form of the section, used in reference cache keys
+        self._section_key = tuple(parts)
+        # Resolved on the first assignment, so empty sections create no dicts
+        self._current_section_dict = None
+
     def _parse_defaults_section(self, lines: List[str], start_idx: int) -> int:
         """
         Parse the 'defaults' section of the UCL file.
@@ -243,12 +551,13 @@ class UCLParser:
                 i += 1
                 continue
 
-            if line.startswith('[') and line.endswith(']'):
+            if line[0] == '[' and line[-1] == ']':
                 raise UCLSyntaxError("Defaults section must be at the end of the file")
 
             if '=' in line:
                 key, value = self._split_key_value(line)
                 self.defaults[key] = self._parse_value(value)
+                self._defaults_prepared = None
 
             i += 1
 
@@ -276,9 +585,9 @@ class UCLParser:
             # a multi-line structure or just empty/comments already removed.
             # If it's not an empty line, section, or json-like structure, it's an error.
             if line and not line.startswith('[') and not line.endswith(']') and \
-               not line.strip() in ['{', '}']:
+               line not in _BRACE_LINES:
                 # Check for characters that indicate it might be part of a JSON structure
-                if not any(c in line for c in ['[', ']', '{', '}', ',', '"', "'"]):
+                if not _RE_STRUCTURE_CHARS.search(line):
                     raise UCLSyntaxError(f"Invalid syntax: line without equals sign: {line}")
             return start_idx + 1
 
@@ -310,21 +619,18 @@ class UCLParser:
         Raises:
             UCLSyntaxError: If no valid '=' separator is found.
         """
-        in_string = False
-        quote_char = None
-
-        for i, char in enumerate(line):
-            if not in_string and char in ['"', "'"]:
-                in_string = True
-                quote_char = char
-            elif in_string and char == quote_char and \
-                    (i == 0 or line[i - 1] != '\\'):
-                # Handle escaped quotes
-                in_string = False
-                quote_char = None
-            elif not in_string and char == '=':
-                key = line[:i].strip()
-                value = line[i + 1:].strip()
+        # Fast path: the '=' comes before any quote, so it cannot be inside a string
+        eq = line.find('=')
+        if eq != -1:
+            q1 = line.find('"', 0, eq)
+            q2 = line.find("'", 0, eq)
+            if q1 == -1 and q2 == -1:
+                return line[:eq].strip(), line[eq + 1:].strip()
+
+        for match in _RE_KEY_VALUE_SCAN.finditer(line):
+            if match.group(1):
+                key = line[:match.start()].strip()
+                value = line[match.end():].strip()
                 return key, value
 
         raise UCLSyntaxError(f"Invalid key-value syntax: {line}")
@@ -346,34 +652,27 @@ class UCLParser:
         value_str = initial_value.strip()
 
         if value_str.startswith('{'):
-            brace_count = value_str.count('{') - value_str.count('}')
-            i = start_idx + 1
-
-            while i < len(lines) and brace_count > 0:
-                line = lines[i].strip()
-                if line:
-                    value_str += '\n' + line
-                    brace_count += line.count('{') - line.count('}')
-                i += 1
-
-            # Ensure we return the index of the last line of the value, not the next line
-            return value_str, i - 1
-
+            open_char, close_char = '{', '}'
         elif value_str.startswith('['):
-            bracket_count = value_str.count('[') - value_str.count(']')
-            i = start_idx + 1
-
-            while i < len(lines) and bracket_count > 0:
-                line = lines[i].strip()
-                if line:
-                    value_str += '\n' + line
-                    bracket_count += line.count('[') - line.count(']')
-                i += 1
+            open_char, close_char = '[', ']'
+        else:
+            return initial_value, start_idx
 
-            # Ensure we return the index of the last line of the value, not the next line
-            return value_str, i - 1
+        depth = value_str.count(open_char) - value_str.count(close_char)
+        chunks = [value_str]
+        i = start_idx + 1
 
-        return initial_value, start_idx
+        while i < len(lines) and depth > 0:
+            line = lines[i].strip()
+            if line:
+                chunks.append(line)
+                # Most lines inside a block carry no delimiters; skip counting those
+                if open_char in line or close_char in line:
+                    depth += line.count(open_char) - line.count(close_char)
+            i += 1
+
+        # Ensure we return the index of the last line of the value, not the next line
+        return '\n'.join(chunks), i - 1
 
     def _parse_value(self, value_str: str) -> Any:
         """
@@ -402,64 +701,47 @@ class UCLParser:
         if not value_str:
             return None
 
-        # 1. Environment variable resolution
-        env_match = re.match(r'\$ENV\{([^}]+)\}', value_str)
-        if env_match:
-            env_var = env_match.group(1)
-            return self.env_vars.get(env_var)
+        # 1. Environment variable resolution (only run the regex when it can match)
+        if '$ENV{' in value_str:
+            env_match = _RE_ENV.match(value_str)
+            if env_match:
+                env_var = env_match.group(1)
+                return os.environ.get(env_var)
+
+        is_simple, has_ops, is_ref = _classify(value_str)
 
         # 2. Explicit type conversion (e.g., "123.int", "4.5.string")
         # Check for type conversion suffix, but not if it's a simple literal ending with .
-        if '.' in value_str and not self._is_simple_literal(value_str):
-            parts = value_str.rsplit('.', 1)
-            if len(parts) == 2 and parts[1] in ['int', 'float', 'string', 'bool']:
-                base_value = self._parse_value(parts[0])  # Recursively parse base
-                try:
-                    return self._convert_type(base_value, parts[1])
-                except UCLTypeError:
-                    raise
+        # Chained suffixes are all stripped up front, so the base is parsed only once.
+        suffixes = []
+        while '.' in value_str and not is_simple:
+            base, _, suffix = value_str.rpartition('.')
+            if suffix not in _TYPE_NAMES:
+                break
+            suffixes.append(suffix)
+            value_str = base.strip()
+            is_simple, has_ops, is_ref = _classify(value_str)
+
+        if not value_str:
+            value = None
 
         # 3. Arithmetic expressions and string concatenation
-        if self._contains_operators(value_str) and not self._is_simple_literal(
-                value_str):
-            return self._evaluate_expression(value_str)
+        elif has_ops and not is_simple:
+            value = self._evaluate_expression(value_str)
 
         # 4. Variable reference resolution (must come after simple literal check)
-        if not self._is_simple_literal(value_str) and self._is_variable_reference(
-                value_str):
-            return self._resolve_reference(value_str)
+        elif is_ref:
+            value = self._resolve_reference(value_str)
 
         # 5. Simple literal parsing (strings, numbers, booleans, null, arrays, objects)
-        return self._parse_simple_value(value_str)
-
-    def _contains_operators(self, value_str: str) -> bool:
-        """
-        Check if a string contains arithmetic operators (+, -, *, /, %) outside of quoted strings.
-
-        This helps differentiate between a value that is a literal string containing
-        an operator (e.g., "my+string") and an actual expression (e.g., "1+2").
+        else:
+            value = self._parse_simple_value(value_str)
 
-        Args:
-            value_str (str): The string to check.
+        # Apply the conversions innermost first
+        for target_type in reversed(suffixes):
+            value = self._convert_type(value, target_type)
 
-        Returns:
-            bool: True if operators are found outside of strings, False otherwise.
-        """
-        in_string = False
-        quote_char = None
-
-        for i, char in enumerate(value_str):
-            if not in_string and char in ['"', "'"]:
-                in_string = True
-                quote_char = char
-            elif in_string and char == quote_char and \
-                    (i == 0 or value_str[i - 1] != '\\'):
-                in_string = False
-                quote_char = None
-            elif not in_string and char in ['+', '-', '*', '/', '%']:
-                return True
-
-        return False
+        return value
 
     def _is_simple_literal(self, value_str: str) -> bool:
         """
@@ -473,34 +755,7 @@ class UCLParser:
         Returns:
             bool: True if the string is a simple literal, False otherwise.
         """
-        value_str = value_str.strip()
-
-        # Quoted string literal
-        if (value_str.startswith('"') and value_str.endswith('"') and 
-        not self._contains_operators(value_str)):
-            # Only consider it a simple string if it doesn't also look like an expression
-            # inside (e.g. "'1+2'") - though _parse_string handles escapes for real strings.
-            # This is primarily to distinguish "ref" from "literal" and not evaluate "ref"
-            # as an expression.
-            return True
-
-        # JSON array or object literal
-        if (value_str.startswith('[') and value_str.endswith(']')) or \
-           (value_str.startswith('{') and value_str.endswith('}')):
-            return True
-
-        # Boolean or null literal (case-insensitive)
-        if value_str.lower() in ['true', 'false', 'null']:
-            return True
-
-        # Numeric literal
-        try:
-            float(value_str)  # Try converting to float for both int and float
-            return True
-        except ValueError:
-            pass
-
-        return False
+        return _classify(value_str)[0]
 
     def _parse_simple_value(self, value_str: str) -> Any:
         """
@@ -520,11 +775,10 @@ class UCLParser:
         """
         value_str = value_str.strip()
 
-        if value_str.lower() == 'null':
-            return None
-
-        if value_str.lower() in ['true', 'false']:
-            return value_str.lower() == 'true'
+        lowered = value_str.lower()
+        if lowered in _LITERAL_WORDS:
+            # null, true or false (case-insensitive)
+            return None if lowered == 'null' else lowered == 'true'
 
         # Strings with quotes
         if (value_str.startswith('"') and value_str.endswith('"')) or \
@@ -538,7 +792,7 @@ class UCLParser:
         # Objects (parsed as JSON)
         if value_str.startswith('{') and value_str.endswith('}'):
             try:
-                return json.loads(value_str)
+                return _json_loads(value_str)
             except json.JSONDecodeError as e:
                 raise UCLSyntaxError(f"Invalid JSON object: {e} in '{value_str}'")
 
@@ -566,32 +820,11 @@ class UCLParser:
         Returns:
             str: The string with escape sequences resolved.
         """
-        escape_sequences = {
-            'n': '\n',
-            't': '\t',
-            'r': '\r',
-            '\\': '\\',
-            '"': '"',
-            "'": "'"
-        }
-
-        result = []
-        i = 0
-        while i < len(s):
-            if s[i] == '\\' and i + 1 < len(s):
-                next_char = s[i + 1]
-                if next_char in escape_sequences:
-                    result.append(escape_sequences[next_char])
-                    i += 2  # Skip backslash and the escaped character
-                else:
-                    # Keep the backslash if it's not a recognized escape
-                    result.append(s[i])
-                    i += 1
-            else:
-                result.append(s[i])
-                i += 1
+        if '\\' not in s:
+            return s
 
-        return ''.join(result)
+        # Unrecognized escapes are not matched, so their backslash is kept
+        return _RE_ESCAPE.sub(_resolve_escape, s)
 
     def _parse_array(self, array_str: str) -> List[Any]:
         """
@@ -610,61 +843,34 @@ class UCLParser:
             return []
 
         # Replace newlines with spaces within the content for easier tokenization
-        content = re.sub(r'\s*\n\s*', ' ', content)
+        if '\n' in content:
+            content = _RE_ARRAY_WS.sub(' ', content)
 
-        elements = []
-        current_element = ""
-        bracket_count = 0  # To track nested arrays
-        brace_count = 0  # To track nested objects
-        in_string = False
-        quote_char = None
-        i = 0
+        # Blank out quoted strings (keeping offsets intact) so that only structural
+        # characters outside of strings are seen when looking for separators
+        masked = _RE_STRIP_STRINGS.sub(_mask_string, content)
 
-        while i < len(content):
-            char = content[i]
-
-            if not in_string and char in ['"', "'"]:
-                in_string = True
-                quote_char = char
-                current_element += char
-            elif in_string and char == quote_char:
-                if i > 0 and content[i - 1] == '\\':
-                    # It's an escaped quote within a string, keep it
-                    current_element += char
-                else:
-                    # End of string literal
-                    in_string = False
-                    quote_char = None
-                    current_element += char
-            elif not in_string:
-                if char == '[':
-                    bracket_count += 1
-                    current_element += char
-                elif char == ']':
-                    bracket_count -= 1
-                    current_element += char
-                elif char == '{':
-                    brace_count += 1
-                    current_element += char
-                elif char == '}':
-                    brace_count -= 1
-                    current_element += char
-                elif char == ',' and bracket_count == 0 and brace_count == 0:
-                    # Only split by comma if not inside a nested structure or string
-                    if current_element.strip():
-                        elements.append(self._parse_value(current_element.strip()))
-                    current_element = ""
-                else:
-                    current_element += char
-            else:
-                # Inside a string, just append the character
-                current_element += char
-
-            i += 1
+        elements = []
+        depth = 0  # Nesting level of arrays/objects
+        start = 0
+
+        for match in _RE_ARRAY_DELIMS.finditer(masked):
+            char = match.group()
+            if char in '[{':
+                depth += 1
+            elif char in ']}':
+                depth -= 1
+            elif depth == 0:
+                # Only split by comma if not inside a nested structure or string
+                element = content[start:match.start()].strip()
+                if element:
+                    elements.append(self._parse_value(element))
+                start = match.end()
 
         # Add the last element if any
-        if current_element.strip():
-            elements.append(self._parse_value(current_element.strip()))
+        element = content[start:].strip()
+        if element:
+            elements.append(self._parse_value(element))
 
         return elements
 
@@ -684,65 +890,83 @@ class UCLParser:
         Raises:
             UCLTypeError: If operands are incompatible for an operation.
             UCLReferenceError: If a reference within the expression cannot be resolved.
+            UCLSyntaxError: If the expression is malformed.
         """
-        # First, evaluate expressions within parentheses
-        # This loop continues until no more parentheses are found
-        while '(' in expr:
-            # Find the innermost opening parenthesis
-            start = expr.rfind('(')
-            if start == -1:  # No more opening parentheses
-                break
+        # Single pass over the tokens: each parenthesized group is evaluated as
+        # soon as it closes and its value (not its string form) is handed to the
+        # enclosing group. The stack holds the operands/operators of open groups.
+        groups = [[]]
+
+        for token in self._tokenize_expression(expr):
+            if token == '(':
+                groups.append([])
+            elif token == ')':
+                if len(groups) == 1:
+                    raise UCLSyntaxError(f"Mismatched parentheses in expression: {expr}")
+                inner = groups.pop()
+                groups[-1].append(self._evaluate_simple_expression(inner))
+            elif token in _OPERATORS:
+                groups[-1].append(token)
+            else:
+                groups[-1].append(self._parse_operand(token))
+
+        if len(groups) != 1:
+            raise UCLSyntaxError(f"Mismatched parentheses in expression: {expr}")
 
-            # Find the corresponding closing parenthesis
-            end = expr.find(')', start)
-            if end == -1:
-                raise UCLSyntaxError(f"Mismatched parentheses in expression: {expr}")
+        return self._evaluate_simple_expression(groups[0])
 
-            inner_expr = expr[start + 1:end]
-            result = self._evaluate_simple_expression(inner_expr)
-            # Replace the parenthesized expression with its result
-            expr = expr[:start] + str(result) + expr[end + 1:]
+    def _parse_operand(self, token: str) -> Any:
+        """
+        Convert an expression operand token to its Python value.
 
-        # Finally, evaluate the simplified expression (no parentheses)
-        return self._evaluate_simple_expression(expr)
+        Args:
+            token (str): The operand token (a literal or a reference).
 
-    def _evaluate_simple_expression(self, expr: str) -> Any:
+        Returns:
+            Any: The parsed literal or the resolved reference.
+        """
+        if self._is_simple_literal(token):
+            return self._parse_simple_value(token)
+        elif self._is_variable_reference(token):
+            return self._resolve_reference(token)
+        else:
+            # If it's neither a simple literal nor a reference,
+            # try parsing it as a simple value anyway (might be a plain word)
+            return self._parse_simple_value(token)
+
+    def _evaluate_simple_expression(self, tokens: List[Any]) -> Any:
         """
         Evaluate a simple expression (without parentheses) respecting operator precedence.
 
         Order of operations: *, /, % then +, - (including string concatenation).
 
         Args:
-            expr (str): The expression string without parentheses.
+            tokens (List[Any]): Operand values alternating with operator tokens.
 
         Returns:
             Any: The result of the evaluation.
+
+        Raises:
+            UCLSyntaxError: If an operator has no right-hand operand.
         """
-        tokens = self._tokenize_expression(expr)
-
-        # First pass: Convert all literal/reference tokens to their Python values
-        # and handle type conversions (like ".int") if they exist as a standalone token.
-        for i, token in enumerate(tokens):
-            if not self._is_operator(token):
-                if self._is_simple_literal(token):
-                    tokens[i] = self._parse_simple_value(token)
-                elif self._is_variable_reference(token):
-                    tokens[i] = self._resolve_reference(token)
-                else:
-                    # If it's neither a simple literal nor a reference,
-                    # try parsing it as a simple value anyway (might be a plain word)
-                    tokens[i] = self._parse_simple_value(token)
-
-        # Second pass: Handle multiplication, division, and modulo
-        i = 1
-        while i < len(tokens):
-            if i < len(tokens) and tokens[i] in ['*', '/', '%']:
-                left = self._to_number(tokens[i - 1])
+        # Each pass folds an operator into the operand before it in a new list,
+        # so every reduction is O(1) instead of rebuilding the token list.
+        # Operands can be unhashable values (lists, dicts), so only strings are
+        # looked up in the operator sets.
+
+        # First pass: Handle multiplication, division, and modulo
+        reduced = tokens[:1]
+        for i in range(1, len(tokens), 2):
+            op = tokens[i]
+            if isinstance(op, str) and op in _MULDIV:
+                if i + 1 == len(tokens):
+                    raise UCLSyntaxError(f"Missing operand after '{op}' in expression")
+                left = self._to_number(reduced[-1])
                 right = self._to_number(tokens[i + 1])
 
-                if tokens[i] == '*':
+                if op == '*':
                     result = left * right
-                elif tokens[i] == '/':
+                elif op == '/':
                     if right == 0:
                         raise UCLTypeError("Division by zero")
                     result = left / right
@@ -752,18 +976,22 @@ class UCLParser:
                     result = left % right
 
                 # Replace the operand-operator-operand triplet with the result
-                tokens = tokens[:i - 1] + [result] + tokens[i + 2:]
+                reduced[-1] = result
             else:
-                i += 2  # Move to the next potential operator
-
-        # Third pass: Handle addition and subtraction
-        i = 1
-        while i < len(tokens):
-            if i < len(tokens) and tokens[i] in ['+', '-']:
-                left = tokens[i - 1]
+                reduced.extend(tokens[i:i + 2])  # Keep for the next pass
+
+        # Second pass: Handle addition and subtraction
+        tokens = reduced
+        reduced = tokens[:1]
+        for i in range(1, len(tokens), 2):
+            op = tokens[i]
+            if isinstance(op, str) and op in _ADDSUB:
+                if i + 1 == len(tokens):
+                    raise UCLSyntaxError(f"Missing operand after '{op}' in expression")
+                left = reduced[-1]
                 right = tokens[i + 1]
 
-                if tokens[i] == '+':
+                if op == '+':
                     # String concatenation if either operand is a string
                     if isinstance(left, str) or isinstance(right, str):
                         result = str(left) + str(right)
@@ -773,16 +1001,16 @@ class UCLParser:
                     result = self._to_number(left) - self._to_number(right)
 
                 # Replace the operand-operator-operand triplet with the result
-                tokens = tokens[:i - 1] + [result] + tokens[i + 2:]
+                reduced[-1] = result
             else:
-                i += 2  # Move to the next potential operator
+                reduced.extend(tokens[i:i + 2])
 
-        return tokens[0] if tokens else None
+        return reduced[0] if reduced else None
 
     def _tokenize_expression(self, expr: str) -> List[str]:
         """
-        Tokenize an expression string into a list of operands and operators.
-        Handles quoted strings as single tokens.
+        Tokenize an expression string into a list of operands, operators and
+        parentheses. Handles quoted strings as single tokens.
 
         Args:
             expr (str): The expression string.
@@ -790,57 +1018,9 @@ class UCLParser:
         Returns:
             List[str]: A list of tokens.
         """
-        tokens = []
-        current_token = ""
-        in_string = False
-        quote_char = None
-
-        for char in expr:
-            if not in_string and char in ['"', "'"]:
-                # Start of a quoted string
-                if current_token.strip():
-                    tokens.append(current_token.strip())
-                current_token = char
-                in_string = True
-                quote_char = char
-            elif in_string and char == quote_char:
-                # End of a quoted string
-                current_token += char
-                tokens.append(current_token)
-                current_token = ""
-                in_string = False
-                quote_char = None
-            elif not in_string and char in ['+', '-', '*', '/', '%']:
-                # Operator encountered outside a string
-                if current_token.strip():
-                    tokens.append(current_token.strip())
-                tokens.append(char)
-                current_token = ""
-            elif char.isspace() and not in_string:
-                # Whitespace outside a string, finalize current token
-                if current_token.strip():
-                    tokens.append(current_token.strip())
-                current_token = ""
-            else:
-                # Regular character, append to current token
-                current_token += char
-
-        if current_token.strip():
-            tokens.append(current_token.strip())
-
-        return tokens
-
-    def _is_operator(self, token: str) -> bool:
-        """
-        Check if a given token is an arithmetic operator.
-
-        Args:
-            token (str): The token to check.
-
-        Returns:
-            bool: True if the token is an operator, False otherwise.
-        """
-        return token in ['+', '-', '*', '/', '%']
+        # Quoted strings, operators/parentheses and runs of other non-space
+        # characters; whitespace between tokens is skipped
+        return _RE_EXPR_TOKEN.findall(expr)
 
     def _to_number(self, value: Any) -> Union[int, float]:
         """
@@ -858,13 +1038,16 @@ class UCLParser:
         if isinstance(value, (int, float)):
             return value
 
+        text = value if isinstance(value, str) else str(value)
+
+        # int() rejects anything with a dot or exponent, so try it first
         try:
-            # If it contains a dot or 'e' (for scientific notation), treat as float
-            if isinstance(value, str) and ('.' in value or 'e' in value.lower()):
-                return float(value)
-            # Otherwise, try converting to integer
-            else:
-                return int(value)
+            return int(text)
+        except ValueError:
+            pass
+
+        try:
+            return float(text)
         except ValueError:
             raise UCLTypeError(f"Cannot convert '{value}' to number")
 
@@ -881,14 +1064,7 @@ class UCLParser:
         Returns:
             bool: True if it appears to be a variable reference, False otherwise.
         """
-        if self._is_simple_literal(value_str):
-            return False
-
-        # If it contains dots (e.g., "section.key")
-        # Or if it's a plain word (e.g., "my_variable")
-        # Ensure it's not empty and doesn't start/end with non-alphanumeric chars
-        return '.' in value_str or bool(
-            re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', value_str))
+        return _classify(value_str)[2]
 
     def _resolve_reference(self, ref: str) -> Any:
         """
@@ -906,85 +1082,101 @@ class UCLParser:
         Raises:
             UCLReferenceError: If the reference cannot be resolved.
         """
-        if '[' in ref and ']' in ref:
+        # Resolved references are memoized until the configuration changes
+        key = (ref, self._section_key)
+        value = self._ref_cache.get(key, _MISS)
+        if value is _MISS:
+            value = self._lookup_reference(ref)
+            self._ref_cache[key] = value
+        return value
+
+    def _lookup_reference(self, ref: str) -> Any:
+        """
+        Resolve a variable reference against the configuration, bypassing the cache.
+
+        Args:
+            ref (str): The reference string.
+
+        Returns:
+            Any: The resolved value.
+
+        Raises:
+            UCLReferenceError: If the reference cannot be resolved.
+        """
+        bracket_pos = ref.find('[')
+        if bracket_pos != -1 and ref.find(']', bracket_pos) != -1:
             # Handle complex references with array/object access
-            return self._resolve_complex_reference(ref)
+            return self._resolve_complex_reference(ref, bracket_pos)
 
         # Simple dot-separated reference
-        parts = ref.split('.')
+        parts = _split_path(ref)
         current = self.config
 
-        for part in parts:
-            if isinstance(current, dict) and part in current:
+        try:
+            for part in parts:
                 current = current[part]
-            else:
-                # If not found directly, try resolving relative to the current section
-                if self.current_section:
-                    # Construct full path from current section and the reference
-                    potential_full_path = self.current_section + parts
-                    try:
-                        return self._get_nested_value('.'.join(potential_full_path))
-                    except UCLReferenceError:
-                        # If still not found, try the reference as absolute path
-                        pass  # Fall through to original error if not found this way either
-
-                raise UCLReferenceError(f"Cannot resolve reference: {ref}")
+        except (KeyError, TypeError):
+            # If not found directly, try resolving relative to the current section
+            if self.current_section:
+                # Construct full path from current section and the reference
+                potential_full_path = self._section_key + parts
+                try:
+                    return self._get_nested_value_parts(potential_full_path)
+                except UCLReferenceError:
+                    # If still not found, try the reference as absolute path
+                    pass  # Fall through to original error if not found this way either
+
+            raise UCLReferenceError(f"Cannot resolve reference: {ref}")
 
         return current
 
-    def _resolve_complex_reference(self, ref: str) -> Any:
+    def _resolve_complex_reference(self, ref: str, first_bracket: Optional[int] = None) -> Any:
         """
         Resolve complex references involving array indexing and object key access.
         Examples: "myArray[0]", "myDict['key']", "nested.array[1].prop"
 
         Args:
             ref (str): The complex reference string.
+            first_bracket (Optional[int]): Index of the first '[' in `ref`, if the
+                caller already found it.
 
         Returns:
             Any: The resolved value.
 
         Raises:
             UCLReferenceError: If any part of the reference cannot be resolved or is invalid.
+            UCLSyntaxError: If the brackets or the quotes around a key do not match.
         """
-        base_ref = ""
+        # The base reference is all text outside the bracketed accessors
+        base_parts = []
         accessors = []  # Stores index (for arrays) or key (for objects)
 
-        i = 0
-        while i < len(ref):
-            if ref[i] == '[':
-                # Found an opening bracket, start parsing an accessor
-                bracket_count = 1
-                j = i + 1  # Start after '['
-                accessor = ""
-
-                while j < len(ref) and bracket_count > 0:
-                    if ref[j] == '[':
-                        bracket_count += 1
-                    elif ref[j] == ']':
-                        bracket_count -= 1
-
-                    if bracket_count > 0:  # Add to accessor until matching ']' is found
-                        accessor += ref[j]
-                    j += 1
-
-                if bracket_count != 0:
-                    raise UCLSyntaxError(f"Mismatched brackets in reference: {ref}")
-
-                accessors.append(accessor)
-                i = j  # Move index past the closing bracket
-            else:
-                # Accumulate characters for the base reference until a bracket is found
-                base_ref += ref[i]
-                i += 1
+        pos = 0
+        open_idx = ref.find('[') if first_bracket is None else first_bracket
+        while open_idx != -1:
+            close_idx = _find_matching_bracket(ref, open_idx)
+            base_parts.append(ref[pos:open_idx])
+            accessors.append(ref[open_idx + 1:close_idx])
+            pos = close_idx + 1  # Move past the closing bracket
+            open_idx = ref.find('[', pos)
+
+        base_parts.append(ref[pos:])
+        base_ref = ''.join(base_parts)
 
         # Resolve the base reference first
         base_value = self._resolve_reference(base_ref)
 
         current = base_value
         for accessor in accessors:
-            # Try to convert accessor to integer for array index
-            if accessor.isdigit():
-                index = int(accessor)
+            # Accessors starting with a digit are array indices; parse them in one go
+            index = None
+            if accessor[:1].isdigit():
+                try:
+                    index = int(accessor)
+                except ValueError:
+                    pass
+
+            if index is not None:
                 if isinstance(current, list):
                     if 0 <= index < len(current):
                         current = current[index]
@@ -994,8 +1186,12 @@ class UCLParser:
                     raise UCLReferenceError(
                         f"Attempted to index a non-array value at '{base_ref}': {ref}")
             else:
-                # Otherwise, treat as an object key (strip quotes if present)
-                key = accessor.strip('"\'')
+                # Otherwise, treat as an object key (remove quotes if present)
+                key = accessor
+                if accessor[:1] in ('"', "'"):
+                    if len(accessor) < 2 or accessor[-1] != accessor[0]:
+                        raise UCLSyntaxError(f"Mismatched quotes in reference: {ref}")
+                    key = accessor[1:-1]
                 if isinstance(current, dict):
                     if key in current:
                         current = current[key]
@@ -1020,42 +1216,10 @@ class UCLParser:
         Raises:
             UCLTypeError: If the conversion is not possible or the target type is unknown.
         """
-        if target_type == 'int':
-            try:
-                # Convert via float first to handle string floats like "123.0"
-                return int(float(str(value)))
-            except ValueError:
-                raise UCLTypeError(f"Cannot convert '{value}' to int")
-
-        elif target_type == 'float':
-            try:
-                return float(value)
-            except ValueError:
-                raise UCLTypeError(f"Cannot convert '{value}' to float")
-
-        elif target_type == 'string':
-            if isinstance(value, bool):
-                return str(value).lower()  # "true" or "false"
-            return str(value)
-
-        elif target_type == 'bool':
-            if isinstance(value, bool):
-                return value
-            elif isinstance(value, (int, float)):
-                return value != 0  # 0 is False, any other number is True
-            elif isinstance(value, str):
-                lower_val = value.lower()
-                if lower_val in ['true', 'yes', '1']:
-                    return True
-                elif lower_val in ['false', 'no', '0']:
-                    return False
-                else:
-                    raise UCLTypeError(f"Cannot convert string '{value}' to bool")
-            else:
-                raise UCLTypeError(f"Cannot convert '{value}' to bool")
-
-        else:
+        converter = _CONVERTERS.get(target_type)
+        if converter is None:
             raise UCLTypeError(f"Unknown target type: {target_type}")
+        return converter(value)
 
     def _set_nested_value(self, key: str, value: Any) -> None:
         """
@@ -1068,22 +1232,23 @@ class UCLParser:
             key (str): The key for the value being set.
             value (Any): The value to set.
         """
-        full_path = self.current_section + [key]
-
-        current = self.config
-        for part in full_path[:-1]:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
-
-        current[full_path[-1]] = value
-
-    def _get_nested_value(self, path: str) -> Any:
+        current = self._current_section_dict
+        if current is None:
+            # First key in this section: walk to its dict once and keep it
+            current = self.config
+            for part in self.current_section:
+                current = current.setdefault(part, {})
+            self._current_section_dict = current
+
+        current[key] = value
+        self._ref_cache.clear()
+
+    def _get_nested_value_parts(self, parts: Sequence[str]) -> Any:
         """
-        Get a nested value from the configuration dictionary using a dot-separated path.
+        Get a nested value from the configuration dictionary using an already split path.
 
         Args:
-            path (str): The dot-separated path to the value (e.g., "section.subsection.key").
+            parts (Sequence[str]): The path components (e.g., `("section", "key")`).
 
         Returns:
             Any: The value at the specified path.
@@ -1091,14 +1256,14 @@ class UCLParser:
         Raises:
             UCLReferenceError: If any part of the path does not exist.
         """
-        parts = path.split('.')
         current = self.config
 
-        for part in parts:
-            if isinstance(current, dict) and part in current:
+        # Paths usually resolve, so index directly; a non-dict level raises TypeError
+        try:
+            for part in parts:
                 current = current[part]
-            else:
-                raise UCLReferenceError(f"Path not found: {path}")
+        except (KeyError, TypeError):
+            raise UCLReferenceError(f"Path not found: {'.'.join(parts)}")
 
         return current
 
@@ -1109,36 +1274,36 @@ class UCLParser:
         Default values are applied only if the corresponding key is not explicitly
         set in the main configuration or if its value is `null`.
         """
-        for path, default_value in self.defaults.items():
+        if self._defaults_prepared is None:
+            # Split the paths once; reset to None whenever `defaults` changes
+            self._defaults_prepared = [(_split_path(path), value)
+                                       for path, value in self.defaults.items()]
+
+        for parts, default_value in self._defaults_prepared:
             try:
-                current_value = self._get_nested_value(path)
+                current_value = self._get_nested_value_parts(parts)
                 # Apply default only if current value is None
                 if current_value is None:
-                    self._set_nested_value_by_path(path, default_value)
+                    self._set_nested_value_by_parts(parts, default_value)
             except UCLReferenceError:
                 # If the path doesn't exist at all, apply the default
-                self._set_nested_value_by_path(path, default_value)
+                self._set_nested_value_by_parts(parts, default_value)
 
-    def _set_nested_value_by_path(self, path: str, value: Any) -> None:
+    def _set_nested_value_by_parts(self, parts: Sequence[str], value: Any) -> None:
         """
-        Set a nested value in the configuration dictionary given a full dot-separated path.
-
-        This method is similar to `_set_nested_value` but takes a full path string
-        instead of relying on `current_section`.
+        Set a nested value in the configuration dictionary given an already split path.
 
         Args:
-            path (str): The full dot-separated path to the key (e.g., "section.subsection.key").
+            parts (Sequence[str]): The path components (e.g., `("section", "key")`).
             value (Any): The value to set.
         """
-        parts = path.split('.')
         current = self.config
 
         for part in parts[:-1]:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
+            current = current.setdefault(part, {})
 
         current[parts[-1]] = value
+        self._ref_cache.clear()
 
 
 def parse_ucl_file(filepath: Union[str, Path]) -> Dict[str, Any]:
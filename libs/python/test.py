@@ -2,65 +2,89 @@ import unittest
 import os
 import tempfile
 import shutil
+from functools import lru_cache
 from pathlib import Path
+from textwrap import dedent
+from unittest.mock import patch
 from parser import (
     UCLParser, parse_ucl_file, parse_ucl_string,
     UCLError, UCLSyntaxError, UCLReferenceError, UCLTypeError
 )
 
 
-class TestUCLParser(unittest.TestCase):
-    """Comprehensive test suite for UCL Parser."""
-    
-    def setUp(self):
-        """Set up test environment."""
-        self.parser = UCLParser()
-        self.test_dir = Path(__file__).parent / "test_files"
-        
-        # Set up environment variables for testing
-        os.environ['UCL_APP_ENV'] = 'production'
-        os.environ['UCL_API_SECRET_KEY'] = 'secret123'
-        os.environ['UCL_HOSTNAME'] = 'test-host'
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        # Clean up environment variables
-        for key in ['UCL_APP_ENV', 'UCL_API_SECRET_KEY', 'UCL_HOSTNAME']:
-            if key in os.environ:
-                del os.environ[key]
-    
-    def test_basic_key_value_pairs(self):
-        """Test basic key-value pair parsing."""
-        content = '''
+# Environment variables patched in for each TestUCLParser test
+_TEST_ENV = {
+    'UCL_APP_ENV': 'production',
+    'UCL_API_SECRET_KEY': 'secret123',
+    'UCL_HOSTNAME': 'test-host',
+}
+# Part of the parse cache key, so cached results never cross environments
+_ENV_KEYS = tuple(_TEST_ENV)
+
+
+# One parser for every test that parses through `_parse`
+_SHARED_PARSER = UCLParser()
+
+
+@lru_cache(maxsize=None)
+def _cached_parse(content, env_key):
+    """Parse `content`; `env_key` is unused but keeps cached results per environment."""
+    return _SHARED_PARSER.parse_string(content)
+
+
+def _parse(content):
+    """
+    Parse UCL content, reusing the result of an identical earlier parse.
+
+    Results are shared between callers, so tests must not mutate them.
+    """
+    return _cached_parse(content, tuple(os.environ.get(key) for key in _ENV_KEYS))
+
+
+def tearDownModule():
+    """Drop cached parse results."""
+    _cached_parse.cache_clear()
+
+
+def _ucl(text):
+    """Dedent and trim an indented UCL source literal (done once, at import)."""
+    return dedent(text).strip()
+
+
+# UCL sources shared by the tests below. They are dedented up front, except for
+# the whitespace test, whose source is deliberately left as written.
+_CONTENT_BASIC_KEY_VALUE_PAIRS = _ucl('''
         [Application]
         name = "Test App"
         version = "1.0.0"
-        '''
-        
-        result = parse_ucl_string(content)
-        
-        self.assertEqual(result['Application']['name'], "Test App")
-        self.assertEqual(result['Application']['version'], "1.0.0")
-    
-    def test_comments_removal(self):
-        """Test comment removal."""
-        content = '''
+        ''')
+
+_CONTENT_COMMENTS_REMOVAL = _ucl('''
         // Single line comment
         [Section]
         key1 = "value1" // Inline comment
         /* Multi-line
            comment */
         key2 = "value2"
-        '''
-        
-        result = parse_ucl_string(content)
-        
-        self.assertEqual(result['Section']['key1'], "value1")
-        self.assertEqual(result['Section']['key2'], "value2")
-    
-    def test_data_types(self):
-        """Test all supported data types."""
-        content = '''
+        ''')
+
+_CONTENT_COMMENT_MARKERS_IN_STRINGS = _ucl('''
+        [Section]
+        url = "http://example.com" // Inline comment
+        pattern = '/* not a comment */'
+        
+        [Stray]
+        name = O'Brien /* disabled:
+        admin = true */
+        port = 80
+        
+        [StrayWithQuoteInComment]
+        name = O'Brien /* Bob's note */
+        nick = D'Arcy /* disabled: Bob's
+        admin = true */
+        ''')
+
+_CONTENT_DATA_TYPES = _ucl('''
         [Types]
         integer_val = 42
         float_val = 3.14159
@@ -72,34 +96,350 @@ class TestUCLParser(unittest.TestCase):
         null_val = null
         array_val = [1, 2, "three", true]
         json_obj = {"key": "value", "number": 123}
-        '''
-        
-        result = parse_ucl_string(content)
-        types_section = result['Types']
-        
-        self.assertEqual(types_section['integer_val'], 42)
-        self.assertEqual(types_section['float_val'], 3.14159)
-        self.assertEqual(types_section['negative_val'], -10)
-        self.assertEqual(types_section['string_double'], "Hello World")
-        self.assertEqual(types_section['string_single'], "Another string")
-        self.assertTrue(types_section['bool_true'])
-        self.assertFalse(types_section['bool_false'])
-        self.assertIsNone(types_section['null_val'])
-        self.assertEqual(types_section['array_val'], [1, 2, "three", True])
-        self.assertEqual(types_section['json_obj'], {"key": "value", "number": 123})
-    
-    def test_escape_sequences(self):
-        """Test string escape sequences."""
-        content = '''
+        ''')
+
+_EXPECTED_DATA_TYPES = {
+    'integer_val': 42,
+    'float_val': 3.14159,
+    'negative_val': -10,
+    'string_double': "Hello World",
+    'string_single': "Another string",
+    'bool_true': True,
+    'bool_false': False,
+    'null_val': None,
+    'array_val': [1, 2, "three", True],
+    'json_obj': {"key": "value", "number": 123},
+}
+
+_CONTENT_ESCAPE_SEQUENCES = _ucl('''
         [Strings]
         newline = "Line1\\nLine2"
         tab = "Item1\\tItem2"
         quote = "He said, \\"Hello!\\""
         backslash = "Path\\\\to\\\\file"
         carriage_return = "Line1\\rLine2"
+        ''')
+
+_CONTENT_NESTED_SECTIONS = _ucl('''
+        [Level1]
+        key1 = "value1"
+        
+        [Level1.Level2]
+        key2 = "value2"
+        
+        [Level1.Level2.Level3]
+        key3 = "value3"
+        ''')
+
+_CONTENT_ARRAYS = _ucl('''
+        [Arrays]
+        simple = [1, 2, 3]
+        mixed = [1, "two", true, null]
+        nested = [[1, 2], ["a", "b"]]
+        complex = [
+            ["admin", ["create", "read", "update", "delete"]],
+            ["user", ["read"]]
+        ]
+        ''')
+
+_CONTENT_ARITHMETIC_OPERATIONS = _ucl('''
+        [Math]
+        a = 10
+        b = 3
+        sum = a + b
+        diff = a - b
+        product = a * b
+        quotient = a / b
+        remainder = a % b
+        complex = (5 + 3) * 2 / (10 - 6) % 3
+        ''')
+
+_CONTENT_STRING_CONCATENATION = _ucl('''
+        [Strings]
+        first = "Hello"
+        second = "World"
+        greeting = first + ", " + second + "!"
+        with_number = "Version " + 2.0
+        ''')
+
+_CONTENT_PARENTHESIZED_EXPRESSIONS = _ucl('''
+        [Expr]
+        name = "ucl"
+        grouped = ("a" + name) + "-" + (2 * 3)
+        literal_parens = "f(x)" + "!"
+        nested = ((1 + 2) * (3 + 1)) % 5
+        ''')
+
+_CONTENT_VARIABLE_REFERENCES = _ucl('''
+        [Config]
+        base_port = 8000
+        api_port = base_port + 80
+        
+        [Database]
+        host = "localhost"
+        connection = "Host=" + host
+        ''')
+
+_CONTENT_ENVIRONMENT_VARIABLES = _ucl('''
+        [Runtime]
+        env = $ENV{UCL_APP_ENV}
+        secret = $ENV{UCL_API_SECRET_KEY}
+        hostname = $ENV{UCL_HOSTNAME}
+        missing = $ENV{NONEXISTENT_VAR}
+        ''')
+
+_CONTENT_TYPE_CONVERSIONS = _ucl('''
+        [Conversions]
+        str_num = "123"
+        str_float = "3.14"
+        str_bool_true = "yes"
+        str_bool_false = "no"
+        num_bool_zero = 0
+        num_bool_nonzero = 42
+        
+        int_val = str_num.int
+        float_val = str_float.float
+        bool_val_true = str_bool_true.bool
+        bool_val_false = str_bool_false.bool
+        bool_from_zero = num_bool_zero.bool
+        bool_from_nonzero = num_bool_nonzero.bool
+        string_from_num = 123.string
+        string_from_bool = true.string
+        ''')
+
+_CONTENT_DEFAULTS_SECTION = _ucl('''
+        [Config]
+        existing_key = "existing_value"
+        null_key = null
+        
+        [Defaults]
+        Config.existing_key = "default_value"
+        Config.null_key = "default_for_null"
+        Config.new_key = "new_default_value"
+        NewSection.new_key = "another_default"
+        ''')
+
+_CONTENT_SECTION_REDEFINITION = _ucl('''
+        [Section]
+        key1 = "value1"
+        key2 = "original"
+        
+        [Section]
+        key2 = "redefined"
+        key3 = "value3"
+        ''')
+
+_CONTENT_CASE_SENSITIVITY = _ucl('''
+        [Section]
+        myKey = "value1"
+        MyKey = "value2"
+        bool_true = TRUE
+        bool_false = false
+        null_val = NULL
+        ''')
+
+_CONTENT_COMPLEX_REFERENCES = _ucl('''
+        [Data]
+        users = [
+            {"name": "Alice", "id": 1},
+            {"name": "Bob", "id": 2}
+        ]
+        matrix = [["a", "b"], ["c", "d"]]
+        
+        [References]
+        first_user_name = Data.users[0]["name"]
+        matrix_element = Data.matrix[1][0]
+        ''')
+
+_CONTENT_MULTILINE_JSON = _ucl('''
+        [Config]
+        complex_obj = {
+            "database": {
+                "host": "localhost",
+                "port": 5432,
+                "credentials": {
+                    "username": "admin",
+                    "password": "secret"
+                }
+            },
+            "features": ["auth", "logging", "metrics"]
+        }
+        ''')
+
+_CONTENT_COMPREHENSIVE_EXAMPLE = _ucl('''
+        [Application]
+        name = "UCL Demo App"
+        version = "1.0.0-beta"
+        log_level = "DEBUG"
+        
+        [Settings.Numerical]
+        max_retries = 5
+        timeout_seconds = 120.5
+        
+        [Features]
+        enable_telemetry = true
+        use_beta_features = FALSE
+        
+        [Users]
+        admin_emails = ["admin@example.com", "support@example.com"]
+        
+        [Calculations.Numeric]
+        num1 = 7
+        num2 = 4
+        sum = num1 + num2
+        product = num1 * num2
+        
+        [Concatenation.Text]
+        first_name = "John"
+        last_name = "Doe"
+        full_greeting = "Welcome, " + first_name + " " + last_name + "!"
+        
+        [TypeConversion]
+        string_rate = "2.75"
+        shipping_cost_str = "10"
+        converted_rate_float = string_rate.float
+        converted_cost_int = shipping_cost_str.int
+        
+        [Defaults]
+        Application.new_setting = "Default Value"
+        ''')
+
+_EXPECTED_COMPREHENSIVE_EXAMPLE = {
+    'Application': {
+        'name': "UCL Demo App",
+        'version': "1.0.0-beta",
+        'log_level': "DEBUG",
+        'new_setting': "Default Value",  # From the defaults section
+    },
+    'Settings': {'Numerical': {'max_retries': 5, 'timeout_seconds': 120.5}},
+    'Features': {'enable_telemetry': True, 'use_beta_features': False},
+    'Users': {'admin_emails': ["admin@example.com", "support@example.com"]},
+    'Calculations': {'Numeric': {'num1': 7, 'num2': 4, 'sum': 11, 'product': 28}},
+    'Concatenation': {
+        'Text': {
+            'first_name': "John",
+            'last_name': "Doe",
+            'full_greeting': "Welcome, John Doe!",
+        },
+    },
+    'TypeConversion': {
+        'string_rate': "2.75",
+        'shipping_cost_str': "10",
+        'converted_rate_float': 2.75,
+        'converted_cost_int': 10,
+    },
+}
+
+_CONTENT_ONLY_COMMENTS = _ucl('''
+        // Only comments
+        /* Multi-line
+           comment only */
+        ''')
+
+_CONTENT_WHITESPACE_HANDLING = '''
+        
+        [  Section  ]
+        key1   =   "value1"  
+        key2=   "value2"
+        key3 ="value3"   
+        
         '''
+
+_CONTENT_SPECIAL_CHARACTERS_IN_STRINGS = _ucl('''
+        [Special]
+        unicode = "Hello 世界"
+        symbols = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        empty = ""
+        ''')
+
+_CONTENT_LARGE_NUMBERS = _ucl('''
+        [Numbers]
+        large_int = 9223372036854775807
+        large_float = 1.7976931348623157e+308
+        small_float = 2.2250738585072014e-308
+        huge_in_object = {"a": 123456789012345678901234567890}
+        huge_negative_in_array = [-9999999999999999999]
+        ''')
+
+# Files written to a temporary directory for the include tests
+_INCLUDE_FILES = {
+    'main.ucl': _ucl('''
+            [Main]
+            key = "main_value"
+            
+            include "sub.ucl"
+            
+            [After]
+            key = "after_include"
+            '''),
+    'sub.ucl': _ucl('''
+            [Included]
+            key = "included_value"
+            '''),
+    'shared_main.ucl': 'include "a.ucl"\ninclude "b.ucl"\n',
+    'a.ucl': 'include "common.ucl"\n[A]\nkey = "a"\n',
+    'b.ucl': 'include "common.ucl"\n[B]\nkey = "b"\n',
+    'common.ucl': '[Common]\nkey = "common"\n',
+    'loop1.ucl': 'include "loop2.ucl"\n',
+    'loop2.ucl': 'include "loop1.ucl"\n',
+}
+
+
+@patch.dict(os.environ, _TEST_ENV)
+class TestUCLParser(unittest.TestCase):
+    """Comprehensive test suite for UCL Parser."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once for the whole class."""
+        cls.parser = _SHARED_PARSER
+        cls.test_dir = Path(__file__).parent / "test_files"
+        
+        # Write the include fixtures once; the include tests only read them
+        cls.include_dir = Path(tempfile.mkdtemp())
+        for name, text in _INCLUDE_FILES.items():
+            (cls.include_dir / name).write_text(text)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up test environment."""
+        shutil.rmtree(cls.include_dir, ignore_errors=True)
+    
+    def test_basic_key_value_pairs(self):
+        """Test basic key-value pair parsing."""
+        result = _parse(_CONTENT_BASIC_KEY_VALUE_PAIRS)
+        
+        self.assertEqual(result['Application']['name'], "Test App")
+        self.assertEqual(result['Application']['version'], "1.0.0")
+    
+    def test_comments_removal(self):
+        """Test comment removal."""
+        result = _parse(_CONTENT_COMMENTS_REMOVAL)
+        
+        self.assertEqual(result['Section']['key1'], "value1")
+        self.assertEqual(result['Section']['key2'], "value2")
+    
+    def test_comment_markers_in_strings(self):
+        """Test that comment markers inside quoted strings are preserved."""
+        result = _parse(_CONTENT_COMMENT_MARKERS_IN_STRINGS)
+        
+        self.assertEqual(result['Section']['url'], "http://example.com")
+        self.assertEqual(result['Section']['pattern'], "/* not a comment */")
         
-        result = parse_ucl_string(content)
+        # A stray apostrophe in an unquoted value does not hide a block comment
+        self.assertEqual(result['Stray'], {'name': "O'Brien", 'port': 80})
+        self.assertEqual(result['StrayWithQuoteInComment'],
+                         {'name': "O'Brien", 'nick': "D'Arcy"})
+    
+    def test_data_types(self):
+        """Test all supported data types."""
+        result = _parse(_CONTENT_DATA_TYPES)
+        
+        self.assertEqual(result, {'Types': _EXPECTED_DATA_TYPES})
+    
+    def test_escape_sequences(self):
+        """Test string escape sequences."""
+        result = _parse(_CONTENT_ESCAPE_SEQUENCES)
         strings = result['Strings']
         
         self.assertEqual(strings['newline'], "Line1\nLine2")
@@ -110,18 +450,7 @@ class TestUCLParser(unittest.TestCase):
     
     def test_nested_sections(self):
         """Test nested section parsing."""
-        content = '''
-        [Level1]
-        key1 = "value1"
-        
-        [Level1.Level2]
-        key2 = "value2"
-        
-        [Level1.Level2.Level3]
-        key3 = "value3"
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_NESTED_SECTIONS)
         
         self.assertEqual(result['Level1']['key1'], "value1")
         self.assertEqual(result['Level1']['Level2']['key2'], "value2")
@@ -129,18 +458,7 @@ class TestUCLParser(unittest.TestCase):
     
     def test_arrays(self):
         """Test array parsing including nested arrays."""
-        content = '''
-        [Arrays]
-        simple = [1, 2, 3]
-        mixed = [1, "two", true, null]
-        nested = [[1, 2], ["a", "b"]]
-        complex = [
-            ["admin", ["create", "read", "update", "delete"]],
-            ["user", ["read"]]
-        ]
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_ARRAYS)
         arrays = result['Arrays']
         
         self.assertEqual(arrays['simple'], [1, 2, 3])
@@ -153,19 +471,7 @@ class TestUCLParser(unittest.TestCase):
     
     def test_arithmetic_operations(self):
         """Test arithmetic operations."""
-        content = '''
-        [Math]
-        a = 10
-        b = 3
-        sum = a + b
-        diff = a - b
-        product = a * b
-        quotient = a / b
-        remainder = a % b
-        complex = (5 + 3) * 2 / (10 - 6) % 3
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_ARITHMETIC_OPERATIONS)
         math_section = result['Math']
         
         self.assertEqual(math_section['sum'], 13)
@@ -178,48 +484,34 @@ class TestUCLParser(unittest.TestCase):
     
     def test_string_concatenation(self):
         """Test string concatenation."""
-        content = '''
-        [Strings]
-        first = "Hello"
-        second = "World"
-        greeting = first + ", " + second + "!"
-        with_number = "Version " + 2.0
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_STRING_CONCATENATION)
         strings = result['Strings']
         
         self.assertEqual(strings['greeting'], "Hello, World!")
         self.assertEqual(strings['with_number'], "Version 2.0")
     
-    def test_variable_references(self):
-        """Test variable references."""
-        content = '''
-        [Config]
-        base_port = 8000
-        api_port = base_port + 80
+    def test_parenthesized_expressions(self):
+        """Test that parenthesized groups keep their value type."""
+        result = _parse(_CONTENT_PARENTHESIZED_EXPRESSIONS)
+        expr = result['Expr']
         
-        [Database]
-        host = "localhost"
-        connection = "Host=" + host
-        '''
+        self.assertEqual(expr['grouped'], "aucl-6")
+        self.assertEqual(expr['literal_parens'], "f(x)!")
+        self.assertEqual(expr['nested'], 2)
         
-        result = parse_ucl_string(content)
+        with self.assertRaises(UCLSyntaxError):
+            parse_ucl_string('[Expr]\nval = (1 + 2')
+    
+    def test_variable_references(self):
+        """Test variable references."""
+        result = _parse(_CONTENT_VARIABLE_REFERENCES)
         
         self.assertEqual(result['Config']['api_port'], 8080)
         self.assertEqual(result['Database']['connection'], "Host=localhost")
     
     def test_environment_variables(self):
         """Test environment variable resolution."""
-        content = '''
-        [Runtime]
-        env = $ENV{UCL_APP_ENV}
-        secret = $ENV{UCL_API_SECRET_KEY}
-        hostname = $ENV{UCL_HOSTNAME}
-        missing = $ENV{NONEXISTENT_VAR}
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_ENVIRONMENT_VARIABLES)
         runtime = result['Runtime']
         
         self.assertEqual(runtime['env'], 'production')
@@ -229,26 +521,7 @@ class TestUCLParser(unittest.TestCase):
     
     def test_type_conversions(self):
         """Test explicit type conversions."""
-        content = '''
-        [Conversions]
-        str_num = "123"
-        str_float = "3.14"
-        str_bool_true = "yes"
-        str_bool_false = "no"
-        num_bool_zero = 0
-        num_bool_nonzero = 42
-        
-        int_val = str_num.int
-        float_val = str_float.float
-        bool_val_true = str_bool_true.bool
-        bool_val_false = str_bool_false.bool
-        bool_from_zero = num_bool_zero.bool
-        bool_from_nonzero = num_bool_nonzero.bool
-        string_from_num = 123.string
-        string_from_bool = true.string
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_TYPE_CONVERSIONS)
         conv = result['Conversions']
         
         self.assertEqual(conv['int_val'], 123)
@@ -262,19 +535,7 @@ class TestUCLParser(unittest.TestCase):
     
     def test_defaults_section(self):
         """Test defaults section functionality."""
-        content = '''
-        [Config]
-        existing_key = "existing_value"
-        null_key = null
-        
-        [Defaults]
-        Config.existing_key = "default_value"
-        Config.null_key = "default_for_null"
-        Config.new_key = "new_default_value"
-        NewSection.new_key = "another_default"
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_DEFAULTS_SECTION)
         
         # Existing non-null value should not be overridden
         self.assertEqual(result['Config']['existing_key'], "existing_value")
@@ -290,17 +551,7 @@ class TestUCLParser(unittest.TestCase):
     
     def test_section_redefinition(self):
         """Test section redefinition behavior."""
-        content = '''
-        [Section]
-        key1 = "value1"
-        key2 = "original"
-        
-        [Section]
-        key2 = "redefined"
-        key3 = "value3"
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_SECTION_REDEFINITION)
         section = result['Section']
         
         self.assertEqual(section['key1'], "value1")
@@ -309,16 +560,7 @@ class TestUCLParser(unittest.TestCase):
     
     def test_case_sensitivity(self):
         """Test case sensitivity rules."""
-        content = '''
-        [Section]
-        myKey = "value1"
-        MyKey = "value2"
-        bool_true = TRUE
-        bool_false = false
-        null_val = NULL
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_CASE_SENSITIVITY)
         section = result['Section']
         
         # Keys are case-sensitive
@@ -332,20 +574,7 @@ class TestUCLParser(unittest.TestCase):
     
     def test_complex_references(self):
         """Test complex variable references with array/object access."""
-        content = '''
-        [Data]
-        users = [
-            {"name": "Alice", "id": 1},
-            {"name": "Bob", "id": 2}
-        ]
-        matrix = [["a", "b"], ["c", "d"]]
-        
-        [References]
-        first_user_name = Data.users[0]["name"]
-        matrix_element = Data.matrix[1][0]
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_COMPLEX_REFERENCES)
         refs = result['References']
         
         self.assertEqual(refs['first_user_name'], "Alice")
@@ -353,22 +582,7 @@ class TestUCLParser(unittest.TestCase):
     
     def test_multiline_json(self):
         """Test multi-line JSON object parsing."""
-        content = '''
-        [Config]
-        complex_obj = {
-            "database": {
-                "host": "localhost",
-                "port": 5432,
-                "credentials": {
-                    "username": "admin",
-                    "password": "secret"
-                }
-            },
-            "features": ["auth", "logging", "metrics"]
-        }
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_MULTILINE_JSON)
         obj = result['Config']['complex_obj']
         
         self.assertEqual(obj['database']['host'], "localhost")
@@ -387,117 +601,50 @@ class TestUCLParser(unittest.TestCase):
         with self.assertRaises(UCLTypeError):
             parse_ucl_string('[Test]\nval = "abc".int')
         
+        # Non-finite floats cannot become ints
+        with self.assertRaises(UCLTypeError):
+            parse_ucl_string('[Test]\na = 1e400 - 1e400\nval = a.int')
+        with self.assertRaises(UCLTypeError):
+            parse_ucl_string('[Test]\na = 1e400\nval = a.int')
+        with self.assertRaises(UCLTypeError):
+            parse_ucl_string('[Test]\nval = "inf".int')
+        
         # Unresolvable reference
         with self.assertRaises(UCLReferenceError):
             parse_ucl_string('[Test]\nval = nonexistent.key')
+        
+        # Incomplete expression
+        with self.assertRaises(UCLSyntaxError):
+            parse_ucl_string('[Test]\nval = 1 +')
+        
+        # Mismatched quotes around an object key
+        with self.assertRaises(UCLSyntaxError):
+            parse_ucl_string('[Test]\nobj = {"a": 1}\nval = Test.obj["a\']')
     
     def test_includes(self):
         """Test include functionality."""
-        # Create temporary files for testing includes
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create main file
-            main_content = '''
-            [Main]
-            key = "main_value"
-            
-            include "sub.ucl"
-            
-            [After]
-            key = "after_include"
-            '''
-            
-            # Create included file
-            sub_content = '''
-            [Included]
-            key = "included_value"
-            '''
-            
-            main_file = temp_path / "main.ucl"
-            sub_file = temp_path / "sub.ucl"
-            
-            main_file.write_text(main_content)
-            sub_file.write_text(sub_content)
-            
-            result = parse_ucl_file(main_file)
-            
-            self.assertEqual(result['Main']['key'], "main_value")
-            self.assertEqual(result['Included']['key'], "included_value")
-            self.assertEqual(result['After']['key'], "after_include")
-    
-    def test_comprehensive_example(self):
-        """Test a comprehensive example."""
-        content = '''
-        [Application]
-        name = "UCL Demo App"
-        version = "1.0.0-beta"
-        log_level = "DEBUG"
-        
-        [Settings.Numerical]
-        max_retries = 5
-        timeout_seconds = 120.5
-        
-        [Features]
-        enable_telemetry = true
-        use_beta_features = FALSE
+        result = parse_ucl_file(self.include_dir / "main.ucl")
         
-        [Users]
-        admin_emails = ["admin@example.com", "support@example.com"]
-        
-        [Calculations.Numeric]
-        num1 = 7
-        num2 = 4
-        sum = num1 + num2
-        product = num1 * num2
-        
-        [Concatenation.Text]
-        first_name = "John"
-        last_name = "Doe"
-        full_greeting = "Welcome, " + first_name + " " + last_name + "!"
-        
-        [TypeConversion]
-        string_rate = "2.75"
-        shipping_cost_str = "10"
-        converted_rate_float = string_rate.float
-        converted_cost_int = shipping_cost_str.int
-        
-        [Defaults]
-        Application.new_setting = "Default Value"
-        '''
-        
-        result = parse_ucl_string(content)
-        
-        # Test basic values
-        self.assertEqual(result['Application']['name'], "UCL Demo App")
-        self.assertEqual(result['Application']['version'], "1.0.0-beta")
-        
-        # Test numbers
-        self.assertEqual(result['Settings']['Numerical']['max_retries'], 5)
-        self.assertEqual(result['Settings']['Numerical']['timeout_seconds'], 120.5)
-        
-        # Test booleans
-        self.assertTrue(result['Features']['enable_telemetry'])
-        self.assertFalse(result['Features']['use_beta_features'])
-        
-        # Test arrays
-        self.assertEqual(result['Users']['admin_emails'], 
-                       ["admin@example.com", "support@example.com"])
-        
-        # Test arithmetic
-        self.assertEqual(result['Calculations']['Numeric']['sum'], 11)
-        self.assertEqual(result['Calculations']['Numeric']['product'], 28)
+        self.assertEqual(result['Main']['key'], "main_value")
+        self.assertEqual(result['Included']['key'], "included_value")
+        self.assertEqual(result['After']['key'], "after_include")
+    
+    def test_shared_and_circular_includes(self):
+        """Test includes shared by several files and circular includes."""
+        result = parse_ucl_file(self.include_dir / "shared_main.ucl")
         
-        # Test string concatenation
-        self.assertEqual(result['Concatenation']['Text']['full_greeting'], 
-                       "Welcome, John Doe!")
+        self.assertEqual(result['A']['key'], "a")
+        self.assertEqual(result['B']['key'], "b")
+        self.assertEqual(result['Common']['key'], "common")
         
-        # Test type conversions
-        self.assertEqual(result['TypeConversion']['converted_rate_float'], 2.75)
-        self.assertEqual(result['TypeConversion']['converted_cost_int'], 10)
+        with self.assertRaises(UCLError):
+            parse_ucl_file(self.include_dir / "loop1.ucl")
+    
+    def test_comprehensive_example(self):
+        """Test a comprehensive example."""
+        result = _parse(_CONTENT_COMPREHENSIVE_EXAMPLE)
         
-        # Test defaults application
-        self.assertEqual(result['Application']['new_setting'], "Default Value")
+        self.assertEqual(result, _EXPECTED_COMPREHENSIVE_EXAMPLE)
 
 
 class TestUCLParserEdgeCases(unittest.TestCase):
@@ -505,31 +652,31 @@ class TestUCLParserEdgeCases(unittest.TestCase):
     
     def test_empty_file(self):
         """Test parsing empty file."""
-        result = parse_ucl_string("")
+        result = _parse("")
         self.assertEqual(result, {})
     
+    def test_repeated_convenience_calls(self):
+        """Test that consecutive parses share no state."""
+        first = parse_ucl_string('[A]\nx = 1\n[defaults]\nA.y = 2')
+        second = parse_ucl_string('[B]\nz = 3')
+        
+        self.assertEqual(first, {'A': {'x': 1, 'y': 2}})
+        self.assertEqual(second, {'B': {'z': 3}})
+    
+    def test_lone_operator_values(self):
+        """Test that a value consisting of a single operator is kept as text."""
+        result = _parse('[Web]\nallow_origin = *\nsep = -')
+        
+        self.assertEqual(result['Web'], {'allow_origin': '*', 'sep': '-'})
+    
     def test_only_comments(self):
         """Test file with only comments."""
-        content = '''
-        // Only comments
-        /* Multi-line
-           comment only */
-        '''
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_ONLY_COMMENTS)
         self.assertEqual(result, {})
     
     def test_whitespace_handling(self):
         """Test whitespace handling."""
-        content = '''
-        
-        [  Section  ]
-        key1   =   "value1"  
-        key2=   "value2"
-        key3 ="value3"   
-        
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_WHITESPACE_HANDLING)
         section = result['Section']
         
         self.assertEqual(section['key1'], "value1")
@@ -538,14 +685,7 @@ class TestUCLParserEdgeCases(unittest.TestCase):
     
     def test_special_characters_in_strings(self):
         """Test special characters in strings."""
-        content = '''
-        [Special]
-        unicode = "Hello 世界"
-        symbols = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-        empty = ""
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_SPECIAL_CHARACTERS_IN_STRINGS)
         special = result['Special']
         
         self.assertEqual(special['unicode'], "Hello 世界")
@@ -554,19 +694,16 @@ class TestUCLParserEdgeCases(unittest.TestCase):
     
     def test_large_numbers(self):
         """Test large number handling."""
-        content = '''
-        [Numbers]
-        large_int = 9223372036854775807
-        large_float = 1.7976931348623157e+308
-        small_float = 2.2250738585072014e-308
-        '''
-        
-        result = parse_ucl_string(content)
+        result = _parse(_CONTENT_LARGE_NUMBERS)
         numbers = result['Numbers']
         
         self.assertEqual(numbers['large_int'], 9223372036854775807)
         self.assertEqual(numbers['large_float'], 1.7976931348623157e+308)
         self.assertEqual(numbers['small_float'], 2.2250738585072014e-308)
+        # Integers beyond 64 bits inside embedded JSON stay exact ints
+        self.assertEqual(numbers['huge_in_object'], {"a": 123456789012345678901234567890})
+        self.assertEqual(numbers['huge_negative_in_array'], [-9999999999999999999])
+        self.assertIsInstance(numbers['huge_in_object']['a'], int)
 
 
 if __name__ == '__main__':